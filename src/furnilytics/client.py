@@ -1,18 +1,97 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Mapping, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+import asyncio
+import copy
+import hashlib
+import io
 import os
 import json
+import operator
+import re
+import socket
+import time
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
 import pandas as pd
 
+try:
+    # Optional: SIMD-accelerated JSON decoding, 2-5x faster on large payloads.
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    # Optional: HTTP/2 multiplexing for the async fetch path.
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    # Optional: incremental JSON parsing for large /data/{id} responses.
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional: columnar Arrow output via data_arrow().
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
 BASE_URL = "https://furnilytics-api.fly.dev"
 
+# Shared empty frame: empty results hand out cheap shallow copies of this
+# instead of building a fresh BlockManager per call (hot in polling loops).
+_EMPTY_DF = pd.DataFrame()
+
+# Max number of (url, params) entries kept in the per-client ETag cache.
+_ETAG_CACHE_SIZE = 64
+
+# Max number of memoized /metadata/{id} objects per client.
+_META_CACHE_SIZE = 128
+
+# Filenames _disk_path produces (sha1 hex digest + .json); clear_cache only
+# ever deletes these, in case cache_dir points at a shared directory.
+_CACHE_FILE_RE = re.compile(r"^[0-9a-f]{40}\.json$")
+
+# data() switches to incremental (streamed) parsing above this row limit,
+# so large payloads never sit in memory as bytes + dicts + frame at once.
+_STREAM_ROW_THRESHOLD = 5000
+
+# The /health happy path is a fixed literal; matching the raw bytes lets a
+# liveness probe skip JSON parsing entirely.
+_HEALTH_OK_BYTES = b'{"status":"ok"}'
+_HEALTH_OK = {"status": "ok"}
+
+# Prefer newline-delimited rows for /data/{id} when the server offers them:
+# each line parses independently, so work starts before the last byte lands.
+_NDJSON_ACCEPT = "application/x-ndjson, application/json;q=0.8"
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# API date fields use the same YYYY-MM-DD shape as the frm/to parameters.
+_DATE_FORMAT = "%Y-%m-%d"
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _max_age(cache_control: Optional[str]) -> Optional[int]:
+    """Extract max-age seconds from a Cache-Control header (None if absent)."""
+    if not cache_control or "no-store" in cache_control or "no-cache" in cache_control:
+        return None
+    m = _MAX_AGE_RE.search(cache_control)
+    return int(m.group(1)) if m else None
+
 
 class ClientError(Exception): ...
 class AuthError(ClientError): ...
@@ -23,10 +102,145 @@ class RateLimitError(ClientError):
         self.reset_at = reset_at
 
 
+# Error-status dispatch: exception class + default message per known status.
+# 429 is handled separately because RateLimitError carries reset_at.
+_STATUS_HANDLERS = {
+    401: (AuthError, "Invalid or missing API key."),
+    403: (AuthError, "Forbidden."),
+    404: (NotFoundError, "Resource not found."),
+}
+
+
 def _env(k: str) -> Optional[str]:
     return os.getenv(k)
 
 
+def _extract_detail(parsed: Any, is_json: bool, default: str) -> str:
+    """
+    Normalize API error detail into a friendly string.
+    Accepts:
+    - {"detail": "..."}
+    - {"detail": {"msg": "..."}}
+    - "..."
+    """
+    if is_json:
+        if isinstance(parsed, dict):
+            d = parsed.get("detail")
+            if isinstance(d, str) and d.strip():
+                return d
+            if isinstance(d, dict):
+                # common FastAPI patterns
+                if isinstance(d.get("msg"), str) and d["msg"].strip():
+                    return d["msg"]
+                # last resort: compact dict
+                return str(d)
+            # sometimes APIs just return {"message": "..."}
+            m = parsed.get("message")
+            if isinstance(m, str) and m.strip():
+                return m
+        elif isinstance(parsed, str) and parsed.strip():
+            return parsed
+    return default
+
+
+class _TunedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter with socket options tuned for many small GETs to one host:
+    TCP_NODELAY avoids Nagle-induced delays on small requests, SO_KEEPALIVE
+    keeps idle pooled sockets healthy between calls.
+    """
+
+    _SOCKET_OPTIONS = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self._SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _rows_to_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Build a DataFrame from a list of row dicts via a column-oriented transpose.
+
+    Pivoting to dict-of-lists first lets pandas take its fast column path
+    instead of hashing every key of every row dict, which dominates on wide
+    /data/{id} payloads.
+    """
+    if not rows:
+        return _EMPTY_DF.copy(deep=False)
+    cols = list(rows[0].keys())
+    if not cols:
+        # All-empty first row: let pandas produce the same frame as before.
+        return pd.DataFrame(rows)
+    try:
+        # C-speed transpose; only valid when every row has the same keys.
+        getter = operator.itemgetter(*cols)
+        values = zip(*map(getter, rows)) if len(cols) > 1 else (map(getter, rows),)
+        data = {c: list(v) for c, v in zip(cols, values)}
+    except (KeyError, TypeError):
+        # Ragged rows: fall back to per-column .get with None fill.
+        data = {c: [r.get(c) for r in rows] for c in cols}
+    return pd.DataFrame(data, columns=cols, copy=False)
+
+
+def _data_params(frm: Optional[str], to: Optional[str], limit: Optional[int],
+                 filters: Mapping[str, Any]) -> Dict[str, Any]:
+    """Build the query-param dict shared by data() and data_arrow()."""
+    params: Dict[str, Any] = {}
+
+    if frm is not None:
+        params["frm"] = frm
+    if to is not None:
+        params["to"] = to
+    if limit is not None:
+        params["limit"] = int(limit)
+
+    # pass through arbitrary API filters like geo, export_country, import_country
+    for k, v in filters.items():
+        if v is None:
+            continue
+        if isinstance(v, (list, tuple, set)):
+            params[k] = ",".join(str(x) for x in v)
+        else:
+            params[k] = str(v)
+    return params
+
+
+def _ndjson_to_cols(lines: Any) -> Tuple[Dict[str, list], int]:
+    """Parse an iterable of NDJSON lines into SoA column lists."""
+    cols: Dict[str, list] = {}
+    n = 0
+    for line in lines:
+        if not line:
+            continue
+        row = _loads(line)
+        if not isinstance(row, dict):
+            raise ClientError("Unexpected response shape from /data/{id}")
+        for k in row.keys():
+            if k not in cols:
+                cols[k] = [None] * n
+        for k, lst in cols.items():
+            lst.append(row.get(k))
+        n += 1
+    return cols, n
+
+
+def _date_columns_from_schema(schema: Any) -> List[str]:
+    """Pull the names of date-typed fields out of a /metadata/{id} schema."""
+    cols: List[str] = []
+    if isinstance(schema, dict):
+        for name, typ in schema.items():
+            if isinstance(typ, str) and "date" in typ.lower():
+                cols.append(name)
+    elif isinstance(schema, list):
+        for fld in schema:
+            if isinstance(fld, dict) and fld.get("name") and "date" in str(fld.get("type", "")).lower():
+                cols.append(fld["name"])
+    return cols
+
+
 @dataclass
 class Client:
     """
@@ -43,30 +257,98 @@ class Client:
     base_url: str = BASE_URL
     timeout: int = 20
     user_agent: str = "furnilytics-python/0.2.0"
+    # Use HTTP/2 multiplexing on the async path when httpx (+ h2) is installed.
+    http2: bool = True
+    # Optional on-disk ETag cache directory (e.g. ~/.cache/furnilytics) for
+    # cross-process reuse; also settable via FURNILYTICS_CACHE_DIR.
+    cache_dir: str | None = None
 
     _last_meta: Dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+    _async_client: Any = field(default=None, init=False, repr=False)
+    # (path, frozenset(params)) -> (etag, parsed body, monotonic deadline while fresh)
+    _etag_cache: "OrderedDict[Tuple[str, frozenset], Tuple[Optional[str], Any, Optional[float]]]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    # dataset id -> metadata object, memoized for the lifetime of the client
+    _meta_cache: "OrderedDict[str, Dict[str, Any]]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
 
     def __post_init__(self):
         # API key is OPTIONAL (public endpoints work without it)
         if self.api_key is None:
             self.api_key = _env("FURNILYTICS_API_KEY")
 
+        # Fixed layout, mutated in place by _record_meta; last_response_meta
+        # exposes it through a read-only view that tracks the latest request.
+        self._last_meta.update({
+            "method": "GET",
+            "url": None,
+            "params": None,
+            "status": None,
+            "ETag": None,
+            "Cache-Control": None,
+            "Content-Type": None,
+            "Retry-After": None,
+            "X-RateLimit-Reset": None,
+        })
+        # Read-only live view handed out by last_response_meta; the proxy is
+        # allocated once since the dict above is only ever mutated in place.
+        self._last_meta_view = MappingProxyType(self._last_meta)
+
+        # Normalize once; every request builds its URL from this.
+        self._base = self.base_url.rstrip("/")
+
+        # Precompiled URLs + cache keys for the fixed-path endpoints, so the
+        # hot catalog calls skip per-request string building and params plumbing.
+        self._health_url = self._base + "/health"
+        self._datasets_url = self._base + "/datasets"
+        self._datasets_key = ("/datasets", frozenset())
+        self._metadata_url = self._base + "/metadata"
+        self._metadata_key = ("/metadata", frozenset())
+
+        if self.cache_dir is None:
+            self.cache_dir = _env("FURNILYTICS_CACHE_DIR")
+        self._disk_dir: Optional[str] = None
+        if self.cache_dir:
+            try:
+                path = os.path.expanduser(self.cache_dir)
+                os.makedirs(path, exist_ok=True)
+                self._disk_dir = path
+            except OSError:
+                self._disk_dir = None  # unwritable cache dir: run without persistence
+
         self.session = requests.Session()
 
+        # Retry transient connect/read failures (Fly.io cold starts) as well as
+        # bad statuses; jitter spreads retries out, backoff_max caps the wait.
         retries = Retry(
             total=4,
+            connect=4,
+            read=3,
+            status=4,
             backoff_factor=0.6,
+            backoff_jitter=0.3,
+            backoff_max=10.0,
             status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET"],
             raise_on_status=False,
+            respect_retry_after_header=True,
+        )
+        # One API host: a single pool with modest parallelism is plenty.
+        adapter = _TunedHTTPAdapter(
+            max_retries=retries, pool_connections=1, pool_maxsize=8, pool_block=False
         )
-        adapter = HTTPAdapter(max_retries=retries, pool_connections=10, pool_maxsize=20)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
         self.session.headers.update({
             "User-Agent": self.user_agent,
             "Accept": "application/json",
+            # Advertise exactly what urllib3 can decode here: gzip/deflate
+            # always, plus br/zstd when the optional brotli/zstandard
+            # packages are installed (urllib3 detects them for us).
+            "Accept-Encoding": ACCEPT_ENCODING,
         })
 
         # IMPORTANT: new API expects header name "X-API-Key"
@@ -77,11 +359,21 @@ class Client:
     # Basics
     # -------------------------
     def health(self) -> Dict[str, Any]:
-        return self._get_json("/health")
+        r = self.session.get(self._health_url, timeout=self.timeout)
+        # Fast path for the canonical healthy body: skip the JSON parse.
+        if r.status_code == 200 and r.content.strip() == _HEALTH_OK_BYTES:
+            self._record_meta(self._health_url, None, r.status_code, r.headers)
+            return _HEALTH_OK.copy()
+        return self._handle_response(r.status_code, r.headers, r.content, self._health_url, None)
 
     @property
-    def last_response_meta(self) -> Dict[str, Any]:
-        return dict(self._last_meta)
+    def last_response_meta(self) -> Mapping[str, Any]:
+        """
+        Read-only view of the most recent response's meta (method, url,
+        status, caching headers). The view tracks the latest request; take
+        dict(cli.last_response_meta) if you need a frozen snapshot.
+        """
+        return self._last_meta_view
 
     # -------------------------
     # Catalog / metadata
@@ -91,23 +383,50 @@ class Client:
         Returns a DataFrame of the dataset catalog (/datasets).
         API response shape: { ..., "data": [ {id, visibility, topic, subtopic, ...}, ... ] }
         """
-        payload = self._get_json("/datasets")
-        return pd.DataFrame(payload.get("data", []))
+        payload = self._get_json_cached(self._datasets_key, self._datasets_url, None)
+        return _rows_to_frame(payload.get("data", []))
 
     def metadata(self) -> pd.DataFrame:
         """
         Returns DataFrame of metadata items (/metadata).
         API response shape: { ..., "data": [ {id, visibility, topic, subtopic, title, ...}, ... ] }
         """
-        payload = self._get_json("/metadata")
-        return pd.DataFrame(payload.get("data", []))
+        payload = self._get_json_cached(self._metadata_key, self._metadata_url, None)
+        return _rows_to_frame(payload.get("data", []))
 
     def metadata_one(self, dataset_id: str) -> Dict[str, Any]:
         """
         Returns the metadata object for one dataset id (/metadata/{id}).
+        Memoized per client instance; use clear_cache() to force a refetch.
         """
         safe_id = dataset_id.strip("/")
-        return self._get_json(f"/metadata/{safe_id}")
+        cached = self._meta_cache.get(safe_id)
+        if cached is not None:
+            self._meta_cache.move_to_end(safe_id)
+            # Deep copy so callers mutating the result can't poison the cache.
+            return copy.deepcopy(cached)
+        obj = self._get_json(f"/metadata/{safe_id}")
+        if isinstance(obj, dict):
+            self._meta_cache[safe_id] = copy.deepcopy(obj)
+            while len(self._meta_cache) > _META_CACHE_SIZE:
+                self._meta_cache.popitem(last=False)
+            # Copy on the miss path too: obj is the same object held by the
+            # ETag cache, so handing it out uncopied would let callers poison
+            # the body served on later 304 revalidations.
+            return copy.deepcopy(obj)
+        return obj
+
+    def clear_cache(self) -> None:
+        """Drop all memoized responses (ETag cache, per-id metadata, disk cache)."""
+        self._etag_cache.clear()
+        self._meta_cache.clear()
+        if self._disk_dir is not None:
+            for name in os.listdir(self._disk_dir):
+                if _CACHE_FILE_RE.match(name):
+                    try:
+                        os.unlink(os.path.join(self._disk_dir, name))
+                    except OSError:
+                        pass
 
     # -------------------------
     # Data
@@ -120,121 +439,449 @@ class Client:
         frm: Optional[str] = None,
         to: Optional[str] = None,
         limit: Optional[int] = None,
+        parse_dates: bool = True,
         **filters: Any,
     ) -> pd.DataFrame:
         safe_id = dataset_id.strip("/")
-        params: Dict[str, Any] = {}
-
-        if frm is not None:
-            params["frm"] = frm
-        if to is not None:
-            params["to"] = to
-        if limit is not None:
-            params["limit"] = int(limit)
-
-        # pass through arbitrary API filters like geo, export_country, import_country
-        for k, v in filters.items():
-            if v is None:
-                continue
-            if isinstance(v, (list, tuple, set)):
-                params[k] = ",".join(str(x) for x in v)
+        params = _data_params(frm, to, limit, filters)
+
+        # Large responses: parse incrementally off the socket so the payload
+        # never sits in memory as bytes + row dicts + frame all at once.
+        if ijson is not None and (limit is None or limit > _STREAM_ROW_THRESHOLD):
+            df = self._data_streamed(f"/data/{safe_id}", params)
+            if parse_dates and not df.empty:
+                self._parse_date_columns(df, safe_id)
+            return df
+
+        content, resp_headers = self._get_raw(f"/data/{safe_id}", params=params,
+                                              headers={"Accept": _NDJSON_ACCEPT})
+
+        # NDJSON negotiated: one row per line, no array framing to parse.
+        ctype = resp_headers.get("Content-Type") or ""
+        if ctype.startswith("application/x-ndjson"):
+            try:
+                cols, n = _ndjson_to_cols(content.splitlines())
+            except ValueError:
+                raise ClientError("Invalid JSON response from /data/{id}")
+            if n == 0:
+                return _EMPTY_DF.copy(deep=False)
+            df = pd.DataFrame(cols, copy=False)
+            if parse_dates:
+                self._parse_date_columns(df, safe_id)
+            return df
+
+        stripped = content.strip()
+        if stripped == b"[]":
+            return _EMPTY_DF.copy(deep=False)
+
+        df: Optional[pd.DataFrame] = None
+
+        # Fast path: a top-level JSON array goes straight through pandas' C
+        # reader, fusing the JSON decode and the DataFrame build into one pass
+        # with no intermediate list of Python dicts.
+        if stripped[:1] == b"[":
+            try:
+                # dtype=False/convert_axes=False/convert_dates=False: keep the
+                # JSON values as-is (string codes like "004" must stay strings)
+                # so all three parse paths produce identical dtypes.
+                df = pd.read_json(
+                    io.BytesIO(content), orient="records",
+                    dtype=False, convert_axes=False, convert_dates=False,
+                )
+            except ValueError:
+                df = None  # malformed or surprising shape: fall through to _loads
+
+        if df is None:
+            try:
+                rows = _loads(content)
+            except Exception:
+                raise ClientError("Invalid JSON response from /data/{id}")
+
+            if isinstance(rows, list):
+                df = _rows_to_frame(rows)
+            elif isinstance(rows, dict) and "data" in rows:
+                df = _rows_to_frame(rows["data"])
             else:
-                params[k] = str(v)
+                raise ClientError("Unexpected response shape from /data/{id}")
+
+        if parse_dates and not df.empty:
+            self._parse_date_columns(df, safe_id)
+        return df
+
+    def data_many(
+        self,
+        ids: List[str],
+        *,
+        max_workers: int = 8,
+        **kwargs: Any,
+    ) -> Dict[str, Union[pd.DataFrame, ClientError]]:
+        """
+        Fetch several datasets concurrently over the pooled session.
 
-        rows = self._get_json(f"/data/{safe_id}", params=params)
+        Returns a dict keyed by dataset id; ids that fail map to their
+        ClientError instead of a frame, so one bad id doesn't lose the rest.
+        Keyword arguments (frm, to, limit, filters, ...) are passed through to
+        data() for every id. max_workers is capped at the connection pool size.
+        """
+        max_workers = max(1, min(max_workers, 8, len(ids) or 1))
+        results: Dict[str, Union[pd.DataFrame, ClientError]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futures = {ex.submit(self.data, i, **kwargs): i for i in ids}
+            for fut, i in futures.items():
+                try:
+                    results[i] = fut.result()
+                except ClientError as e:
+                    results[i] = e
+        return results
+
+    def data_arrow(
+        self,
+        dataset_id: str,
+        *,
+        frm: Optional[str] = None,
+        to: Optional[str] = None,
+        limit: Optional[int] = None,
+        **filters: Any,
+    ) -> "pa.Table":
+        """
+        Like data(), but returns a columnar pyarrow.Table instead of a
+        DataFrame — handy for piping straight to DuckDB, Polars or Parquet
+        without paying for a pandas conversion. Requires the optional
+        'pyarrow' package; call .to_pandas() if you want a frame after all.
+        """
+        if pa is None:
+            raise ClientError("data_arrow requires the optional 'pyarrow' package (pip install pyarrow).")
+
+        safe_id = dataset_id.strip("/")
+        params = _data_params(frm, to, limit, filters)
+
+        content, _ = self._get_raw(f"/data/{safe_id}", params=params)
+
+        try:
+            rows = _loads(content)
+        except Exception:
+            raise ClientError("Invalid JSON response from /data/{id}")
 
-        if isinstance(rows, list):
-            return pd.DataFrame(rows)
         if isinstance(rows, dict) and "data" in rows:
-            return pd.DataFrame(rows["data"])
+            rows = rows["data"]
+        if not isinstance(rows, list):
+            raise ClientError("Unexpected response shape from /data/{id}")
 
-        raise ClientError("Unexpected response shape from /data/{id}")
+        return pa.Table.from_pylist(rows)
+
+    def _data_streamed(self, path: str, params: Optional[Dict[str, Any]]) -> pd.DataFrame:
+        """
+        Stream a /data/{id} response and parse it incrementally with ijson,
+        accumulating values directly into column lists (SoA) instead of a
+        list of row dicts. Peak memory stays close to the frame itself.
+        """
+        url = self._base + path
+        r = self.session.get(url, params=params, timeout=self.timeout, stream=True,
+                             headers={"Accept": _NDJSON_ACCEPT})
+        with r:
+            if r.status_code >= 400:
+                self._handle_response(r.status_code, r.headers, r.content, url, params)
+            self._record_meta(url, params, r.status_code, r.headers)
+
+            # NDJSON negotiated: parse line by line straight off the socket.
+            ctype = r.headers.get("Content-Type") or ""
+            if ctype.startswith("application/x-ndjson"):
+                try:
+                    cols, n = _ndjson_to_cols(r.iter_lines())
+                except ValueError:
+                    raise ClientError("Invalid JSON response from /data/{id}")
+            else:
+                r.raw.decode_content = True  # undo gzip/deflate before parsing
+                # urllib3 auto-closes the response at EOF; BufferedReader then
+                # raises ValueError instead of returning b"", so keep it open
+                # until the with-block releases the connection.
+                r.raw.auto_close = False
+                buf = io.BufferedReader(r.raw)
+                head = buf.peek(1)[:1]
+                if not head:
+                    return _EMPTY_DF.copy(deep=False)
+                saw_data = True
+                if head == b"[":
+                    rows_iter = ijson.items(buf, "item", use_float=True)
+                elif head == b"{":
+                    # { ..., "data": [rows...] } shape. Watch the event stream
+                    # so a dict without a "data" array raises like the buffered
+                    # path instead of silently yielding an empty frame.
+                    saw_data = False
+
+                    def _watched(events=ijson.parse(buf, use_float=True)):
+                        nonlocal saw_data
+                        for pfx, ev, val in events:
+                            if pfx == "data" and ev == "start_array":
+                                saw_data = True
+                            yield pfx, ev, val
+
+                    rows_iter = ijson.common.items(_watched(), "data.item")
+                else:
+                    raise ClientError("Unexpected response shape from /data/{id}")
+
+                cols = {}
+                n = 0
+                try:
+                    for row in rows_iter:
+                        if not isinstance(row, dict):
+                            raise ClientError("Unexpected response shape from /data/{id}")
+                        for k in row.keys():
+                            if k not in cols:
+                                cols[k] = [None] * n
+                        for k, lst in cols.items():
+                            lst.append(row.get(k))
+                        n += 1
+                except (ijson.JSONError, ValueError):
+                    raise ClientError("Invalid JSON response from /data/{id}")
+                if not saw_data:
+                    raise ClientError("Unexpected response shape from /data/{id}")
+
+        if n == 0:
+            return _EMPTY_DF.copy(deep=False)
+        return pd.DataFrame(cols, copy=False)
+
+    def _parse_date_columns(self, df: pd.DataFrame, safe_id: str) -> None:
+        """
+        Convert date-typed columns in place using the known YYYY-MM-DD format,
+        skipping pandas' per-column format inference. Column names come from
+        the (memoized) /metadata/{id} schema when available, otherwise from a
+        conservative name + value-shape heuristic.
+        """
+        try:
+            meta = self.metadata_one(safe_id)
+            schema = meta.get("schema") if isinstance(meta, dict) else None
+        except (ClientError, requests.RequestException):
+            # The data payload already arrived; a failed side lookup must not
+            # fail the call — fall through to the heuristic below.
+            schema = None
+
+        cols = [c for c in _date_columns_from_schema(schema) if c in df.columns]
+        if not cols:
+            cols = [c for c in df.columns if isinstance(c, str) and "date" in c.lower()]
+
+        for c in cols:
+            sample = df[c].dropna()
+            if sample.empty:
+                continue
+            first = sample.iloc[0]
+            if not (isinstance(first, str) and _DATE_RE.match(first)):
+                continue
+            df[c] = pd.to_datetime(df[c], format=_DATE_FORMAT, cache=True, errors="coerce")
 
     # -------------------------
     # Internal HTTP helper
     # -------------------------
 
+    def _cache_store(self, key: Tuple[str, frozenset], etag: Optional[str], parsed: Any,
+                     fresh_until: Optional[float], persist: bool = True) -> None:
+        if etag is None and fresh_until is None:
+            return
+        self._etag_cache[key] = (etag, parsed, fresh_until)
+        self._etag_cache.move_to_end(key)
+        while len(self._etag_cache) > _ETAG_CACHE_SIZE:
+            self._etag_cache.popitem(last=False)
+        if persist and etag is not None and self._disk_dir is not None:
+            self._disk_store(key, etag, parsed)
+
+    def _disk_path(self, key: Tuple[str, frozenset]) -> str:
+        digest = hashlib.sha1(repr((key[0], sorted(key[1]))).encode()).hexdigest()
+        return os.path.join(self._disk_dir, f"{digest}.json")
+
+    def _disk_load(self, key: Tuple[str, frozenset]) -> Optional[Tuple[str, Any]]:
+        """Read a persisted (etag, body) entry; None if absent or unreadable."""
+        try:
+            with open(self._disk_path(key), "rb") as f:
+                entry = _loads(f.read())
+            return entry["etag"], entry["body"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _disk_store(self, key: Tuple[str, frozenset], etag: str, parsed: Any) -> None:
+        """Persist an (etag, body) entry atomically; failures are non-fatal."""
+        target = self._disk_path(key)
+        tmp = target + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"etag": etag, "body": parsed}, f, separators=(",", ":"))
+            os.replace(tmp, target)
+        except (OSError, TypeError, ValueError):
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
     def _get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], List[Any]]:
-        url = self.base_url.rstrip("/") + path
-        r = self.session.get(url, params=params, timeout=self.timeout)
+        key = (path, frozenset((params or {}).items()))
+        return self._get_json_cached(key, self._base + path, params)
+
+    def _get_json_cached(self, key: Tuple[str, frozenset], url: str,
+                         params: Optional[Dict[str, Any]]) -> Union[Dict[str, Any], List[Any]]:
+        # Conditional-GET cache: serve straight from memory while still fresh
+        # (Cache-Control: max-age), otherwise revalidate with If-None-Match.
+        cached = self._etag_cache.get(key)
+        if cached is None and self._disk_dir is not None:
+            # Warm from the on-disk cache: a cross-process hit turns the first
+            # request of a session into a cheap conditional GET.
+            loaded = self._disk_load(key)
+            if loaded is not None:
+                cached = (loaded[0], loaded[1], None)
+                self._cache_store(key, loaded[0], loaded[1], None, persist=False)
+        headers: Optional[Dict[str, str]] = None
+        if cached is not None:
+            etag, cached_parsed, fresh_until = cached
+            if fresh_until is not None and time.monotonic() < fresh_until:
+                self._etag_cache.move_to_end(key)
+                return cached_parsed
+            if etag:
+                headers = {"If-None-Match": etag}
+
+        r = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+
+        # Not modified: the cached parse is still valid, refresh its freshness window.
+        if r.status_code == 304 and cached is not None:
+            self._record_meta(url, params, r.status_code, r.headers)
+            age = _max_age(r.headers.get("Cache-Control"))
+            fresh_until = time.monotonic() + age if age else cached[2]
+            self._cache_store(key, cached[0], cached[1], fresh_until)
+            return cached[1]
+
+        parsed = self._handle_response(r.status_code, r.headers, r.content, url, params)
+
+        age = _max_age(r.headers.get("Cache-Control"))
+        self._cache_store(
+            key,
+            r.headers.get("ETag"),
+            parsed,
+            time.monotonic() + age if age else None,
+        )
+        return parsed
 
+    # -------------------------
+    # Async fetch (optional, requires httpx)
+    # -------------------------
+
+    def _ensure_async_client(self):
+        if httpx is None:
+            raise ClientError(
+                "Concurrent fetching requires the optional 'httpx' package "
+                "(pip install 'httpx[http2]')."
+            )
+        if self._async_client is None:
+            limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+            try:
+                self._async_client = httpx.AsyncClient(
+                    http2=self.http2,
+                    headers=dict(self.session.headers),
+                    timeout=self.timeout,
+                    limits=limits,
+                )
+            except ImportError:
+                # http2=True needs the 'h2' package; fall back to HTTP/1.1.
+                self._async_client = httpx.AsyncClient(
+                    headers=dict(self.session.headers),
+                    timeout=self.timeout,
+                    limits=limits,
+                )
+        return self._async_client
+
+    async def _get_json_async(self, path: str, params: Optional[Dict[str, Any]] = None) -> Union[Dict[str, Any], List[Any]]:
+        """Async mirror of _get_json (no conditional-GET cache on this path)."""
+        url = self._base + path
+        client = self._ensure_async_client()
+        r = await client.get(url, params=params)
+        return self._handle_response(r.status_code, r.headers, r.content, url, params)
+
+    async def fetch_many(self, specs: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Any]:
+        """
+        Fetch several endpoints concurrently, e.g.:
+
+            await cli.fetch_many([("/health", None), ("/datasets", None), ("/metadata", None)])
+
+        Over HTTP/2 the requests are multiplexed on one connection, so the
+        total latency is roughly that of the slowest single request.
+        """
+        return list(await asyncio.gather(
+            *(self._get_json_async(p, params) for p, params in specs)
+        ))
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def _get_raw(self, path: str, params: Optional[Dict[str, Any]] = None,
+                 headers: Optional[Dict[str, str]] = None) -> Tuple[bytes, Mapping[str, Any]]:
+        """
+        GET a path and return (raw body, response headers), deferring JSON
+        parsing to the caller. The headers are returned directly — not read
+        back from _last_meta, which concurrent requests overwrite. Error
+        statuses still go through _handle_response so they raise the same
+        exceptions as _get_json.
+        """
+        url = self._base + path
+        r = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        if r.status_code >= 400:
+            self._handle_response(r.status_code, r.headers, r.content, url, params)
+        self._record_meta(url, params, r.status_code, r.headers)
+        return r.content, r.headers
+
+    def _record_meta(self, url: str, params: Optional[Dict[str, Any]],
+                     status: int, resp_headers: Mapping[str, Any]) -> None:
+        # Store helpful response meta for debugging / caching. The dict is
+        # preallocated in __post_init__ and mutated in place to avoid building
+        # a fresh 8-key dict per request.
+        m = self._last_meta
+        m["url"] = url
+        m["params"] = params or {}
+        m["status"] = status
+        m["ETag"] = resp_headers.get("ETag")
+        m["Cache-Control"] = resp_headers.get("Cache-Control")
+        m["Content-Type"] = resp_headers.get("Content-Type")
+        m["Retry-After"] = resp_headers.get("Retry-After")
+        m["X-RateLimit-Reset"] = resp_headers.get("X-RateLimit-Reset")
+
+    def _handle_response(self, status: int, resp_headers: Mapping[str, Any], content: bytes,
+                         url: str, params: Optional[Dict[str, Any]]) -> Union[Dict[str, Any], List[Any]]:
+        """
+        Shared response processing for the sync and async paths: parse the body,
+        record meta, and map error statuses to the client exception hierarchy.
+        """
         # Parse JSON once (if possible). Many error responses are JSON too.
         parsed: Any = None
         is_json = False
         try:
-            parsed = r.json()
+            # Decode from bytes: skips requests' implicit .text decode and lets
+            # orjson (when installed) handle UTF-8 internally.
+            parsed = _loads(content)
             is_json = True
         except Exception:
             parsed = None
             is_json = False
 
-        # Store helpful response meta for debugging / caching
-        self._last_meta = {
-            "method": "GET",
-            "url": url,
-            "params": params or {},
-            "status": r.status_code,
-            "ETag": r.headers.get("ETag"),
-            "Cache-Control": r.headers.get("Cache-Control"),
-            "Retry-After": r.headers.get("Retry-After"),
-            "X-RateLimit-Reset": r.headers.get("X-RateLimit-Reset"),
-        }
-
-        def _detail_fallback(default: str) -> str:
-            """
-            Normalize API error detail into a friendly string.
-            Accepts:
-            - {"detail": "..."}
-            - {"detail": {"msg": "..."}}
-            - "..."
-            """
+        self._record_meta(url, params, status, resp_headers)
+
+        # Single branch on the happy path; everything else is a dict lookup.
+        if status < 400:
             if is_json:
-                if isinstance(parsed, dict):
-                    d = parsed.get("detail")
-                    if isinstance(d, str) and d.strip():
-                        return d
-                    if isinstance(d, dict):
-                        # common FastAPI patterns
-                        if isinstance(d.get("msg"), str) and d["msg"].strip():
-                            return d["msg"]
-                        # last resort: compact dict
-                        return str(d)
-                    # sometimes APIs just return {"message": "..."}
-                    m = parsed.get("message")
-                    if isinstance(m, str) and m.strip():
-                        return m
-                elif isinstance(parsed, str) and parsed.strip():
-                    return parsed
-            return default
-
-        # Auth / access control
-        if r.status_code == 401:
-            raise AuthError(_detail_fallback("Invalid or missing API key."))
-        if r.status_code == 403:
-            raise AuthError(_detail_fallback("Forbidden."))
-
-        # Not found
-        if r.status_code == 404:
-            raise NotFoundError(_detail_fallback("Resource not found."))
-
-        # Rate limit
-        if r.status_code == 429:
-            reset = r.headers.get("X-RateLimit-Reset") or r.headers.get("Retry-After")
-            raise RateLimitError(_detail_fallback("Rate limit exceeded."), reset_at=reset)
-
-        # Other 4xx
-        if 400 <= r.status_code < 500:
-            raise ClientError(_detail_fallback(f"Client error ({r.status_code})."))
-
-        # 5xx
-        if 500 <= r.status_code < 600:
-            raise ClientError(_detail_fallback(f"Server error ({r.status_code})."))
-
-        # Success but not JSON (unexpected for this client)
-        if not is_json:
-            snippet = (r.text or "")[:200].strip()
+                return parsed
+            # Success but not JSON (unexpected for this client)
+            snippet = content.decode("utf-8", errors="replace")[:200].strip()
             if snippet:
-                raise ClientError(f"Invalid JSON response (HTTP {r.status_code}): {snippet}")
-            raise ClientError(f"Invalid JSON response (HTTP {r.status_code}).")
-
-        return parsed
\ No newline at end of file
+                raise ClientError(f"Invalid JSON response (HTTP {status}): {snippet}")
+            raise ClientError(f"Invalid JSON response (HTTP {status}).")
+
+        # Rate limit: special-cased for the reset_at attribute
+        if status == 429:
+            reset = resp_headers.get("X-RateLimit-Reset") or resp_headers.get("Retry-After")
+            raise RateLimitError(_extract_detail(parsed, is_json, "Rate limit exceeded."), reset_at=reset)
+
+        handler = _STATUS_HANDLERS.get(status)
+        if handler is not None:
+            exc_cls, default = handler
+        elif status < 500:
+            exc_cls, default = ClientError, f"Client error ({status})."
+        else:
+            exc_cls, default = ClientError, f"Server error ({status})."
+        raise exc_cls(_extract_detail(parsed, is_json, default))
\ No newline at end of file